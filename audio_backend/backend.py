@@ -11,10 +11,14 @@ from __future__ import annotations
 
 
 import os
-import json
+import base64
+import binascii
+import hashlib
 import logging
 import sys
 import random
+import time
+import traceback
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List
@@ -23,7 +27,7 @@ import httpx
 from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel, Field
 
 try:
@@ -49,6 +53,7 @@ sys.path.insert(0, str(Path(__file__).parent ))
 
 from tools_registry import *
 from voice_live_client import VoiceLiveClient, SSMLGenerator
+import json_codec
 
 
 
@@ -58,7 +63,20 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI(title="Realtime Function Calling Backend", version="0.1.0")
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSONResponse rendered through json_codec (orjson when installed)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
+
+
+app = FastAPI(
+    title="Realtime Function Calling Backend",
+    version="0.1.0",
+    default_response_class=CodecJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # demo purposes only; tighten for production
@@ -67,8 +85,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Simple in-memory key-value store for Spark framework
-spark_kv_store: Dict[str, Any] = {}
+# Simple in-memory key-value store for Spark framework; values are kept as
+# serialized JSON so GETs don't re-encode unchanged data
+spark_kv_store: Dict[str, bytes] = {}
 
 
 def _clean_env(name: str, default: str | None = None) -> str:
@@ -93,7 +112,7 @@ REALTIME_SESSION_URL = _clean_env("AZURE_GPT_REALTIME_URL")
 WEBRTC_URL = _clean_env("WEBRTC_URL")
 DEFAULT_DEPLOYMENT = os.getenv("AZURE_GPT_REALTIME_DEPLOYMENT", "gpt-realtime")
 DEFAULT_VOICE = _clean_env("AZURE_GPT_REALTIME_VOICE", "alloy")
-AZURE_API_KEY = os.getenv("AZURE_GPT_REALTIME_KEY").replace('"', '').replace("'", "")
+AZURE_API_KEY = _optional_env("AZURE_GPT_REALTIME_KEY", "")
 
 # Voice Live API Configuration
 VOICE_LIVE_ENDPOINT = _optional_env("VOICE_LIVE_WEBSOCKET_ENDPOINT", "")
@@ -101,6 +120,24 @@ VOICE_LIVE_API_KEY = _optional_env("VOICE_LIVE_API_KEY", "")
 # Use gpt-4o (text-only) to force Azure Speech-to-Text input and Azure TTS output for proper pt-PT
 VOICE_LIVE_MODEL = _optional_env("VOICE_LIVE_MODEL", "gpt-4o")
 VOICE_LIVE_VOICE = _optional_env("VOICE_LIVE_VOICE", "pt-PT-RaquelNeural")
+# Settings advertised to the frontend; the HD voice gives better SSML support with pt-PT
+VOICE_LIVE_CONFIG_VOICE = os.getenv("VOICE_LIVE_VOICE", "en-US-Ava:DragonHDLatestNeural")
+VOICE_LIVE_TEMPERATURE = float(os.getenv("VOICE_LIVE_TEMPERATURE", "0.8"))
+VOICE_LIVE_RATE = os.getenv("VOICE_LIVE_RATE", "1.0")
+VOICE_LIVE_WS_URL = f"{VOICE_LIVE_ENDPOINT}&model={VOICE_LIVE_MODEL}"
+
+# Fixed JSON envelope for relayed microphone audio; base64 output is ASCII and never needs escaping
+_AUDIO_APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = b'"}'
+# Upper bound for microphone audio coalesced into a single append event (~680ms of 24kHz PCM16)
+AUDIO_BATCH_MAX_BYTES = 32 * 1024
+# Frontend messages read ahead of the Azure relay; once full, reading stops so TCP
+# backpressure reaches the browser instead of buffering without bound
+RELAY_INBOX_MAX_MESSAGES = 64
+
+# Render the rich function-call debug pane only when explicitly requested (RICH_DEBUG=1)
+RICH_DEBUG = _optional_env("RICH_DEBUG", "0") == "1"
+_rich_console = Console()
 
 FRONTEND_DIST_DIR = Path(__file__).resolve().parent.parent / "frontend" / "dist"
 FRONTEND_BACKEND_BASE_URL = _optional_env("VITE_BACKEND_BASE_URL", "http://localhost:8080/api")
@@ -110,15 +147,27 @@ print("REALTIME_SESSION_URL", REALTIME_SESSION_URL)
 print("WEBRTC_URL", WEBRTC_URL)
 print("DEFAULT_DEPLOYMENT", DEFAULT_DEPLOYMENT)
 print("DEFAULT_VOICE", DEFAULT_VOICE)
-print("AZURE_API_KEY", AZURE_API_KEY is not None)
+print("AZURE_API_KEY", bool(AZURE_API_KEY))
 print("VOICE_LIVE_ENDPOINT", VOICE_LIVE_ENDPOINT)
 print("VOICE_LIVE_CONFIGURED", bool(VOICE_LIVE_ENDPOINT and VOICE_LIVE_API_KEY))
 
 
 
-credential = DefaultAzureCredential(exclude_interactive_browser_credential=False)
+# Only try the environment, workload/managed identity and Azure CLI sources; skipping the
+# developer-tool credentials keeps cold token acquisition from walking the whole chain
+credential = DefaultAzureCredential(
+    exclude_shared_token_cache_credential=True,
+    exclude_visual_studio_code_credential=True,
+    exclude_powershell_credential=True,
+    exclude_developer_cli_credential=True,
+)
 token_provider = get_bearer_token_provider(credential, "https://cognitiveservices.azure.com/.default")
 
+# Cached AAD bearer token as (token, exp epoch seconds); refreshed ahead of expiry like azure-identity does
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+_token_cache: tuple[str, float] | None = None
+_token_lock = asyncio.Lock()
+
 # Initialize Voice Live client if configured
 voice_live_client: VoiceLiveClient | None = None
 if VOICE_LIVE_ENDPOINT and VOICE_LIVE_API_KEY:
@@ -132,6 +181,10 @@ if VOICE_LIVE_ENDPOINT and VOICE_LIVE_API_KEY:
 else:
     logger.info("⚠️  Voice Live API not configured")
 
+# Availability only depends on startup configuration
+REALTIME_AVAILABLE = bool(REALTIME_SESSION_URL and AZURE_API_KEY)
+VOICELIVE_AVAILABLE = bool(voice_live_client)
+
 
 class SessionRequest(BaseModel):
     deployment: str | None = Field(default=None, description="Azure OpenAI deployment name")
@@ -167,41 +220,85 @@ class ApiModeRequest(BaseModel):
 ToolExecutor = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]] | Dict[str, Any]]
 
 
+# Key-based auth headers never change, so build them once; httpx copies request headers
+_STATIC_AUTH_HEADERS: Dict[str, str] | None = (
+    {"Content-Type": "application/json", "api-key": AZURE_API_KEY} if AZURE_API_KEY else None
+)
+
+
 async def _get_auth_headers() -> Dict[str, str]:
-    headers = {"Content-Type": "application/json"}
-    if AZURE_API_KEY:
-        headers["api-key"] = AZURE_API_KEY
-        return headers
+    if _STATIC_AUTH_HEADERS:
+        return _STATIC_AUTH_HEADERS
 
     # Prefer managed identity / Azure AD tokens when available
-    token = await token_provider()
-    headers["Authorization"] = f"Bearer {token}"
-    return headers
+    token = await _get_bearer_token()
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+
+
+def _token_expiry(token: str) -> float:
+    """Return the ``exp`` claim of a JWT access token, or 0 when it cannot be read."""
+    try:
+        payload = token.split(".")[1]
+        claims = json_codec.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def _cached_token() -> str | None:
+    if _token_cache and _token_cache[1] - TOKEN_REFRESH_MARGIN_SECONDS > time.time():
+        return _token_cache[0]
+    return None
+
+
+async def _get_bearer_token() -> str:
+    """Return a cached AAD token, only hitting the credential chain when it is close to expiry."""
+    global _token_cache
+    token = _cached_token()
+    if token:
+        return token
+
+    async with _token_lock:
+        # Another request may have refreshed the token while we waited for the lock
+        token = _cached_token()
+        if token:
+            return token
+        token = await token_provider()
+        _token_cache = (token, _token_expiry(token))
+        return token
 
 
 def _parse_arguments(arguments: Dict[str, Any] | str) -> Dict[str, Any]:
     if isinstance(arguments, dict):
         return arguments
     try:
-        return json.loads(arguments)
-    except json.JSONDecodeError as exc:  # pragma: no cover - invalid payloads are rare
+        return json_codec.loads(arguments)
+    except json_codec.JSONDecodeError as exc:  # pragma: no cover - invalid payloads are rare
         raise HTTPException(status_code=400, detail=f"Unable to parse arguments JSON: {exc}")
 
 
 
+def _api_mode_response(mode: str) -> CodecJSONResponse:
+    return CodecJSONResponse({
+        "mode": mode,
+        "realtime_available": REALTIME_AVAILABLE,
+        "voicelive_available": VOICELIVE_AVAILABLE,
+        "voice": DEFAULT_VOICE if mode == "realtime" else VOICE_LIVE_VOICE,
+    })
+
+
+# The /api/mode body only varies with API_MODE, so render one response per mode up front
+_API_MODE_RESPONSES = {mode: _api_mode_response(mode) for mode in ("realtime", "voicelive")}
+
+
 @app.get("/api/mode")
-async def get_api_mode() -> Dict[str, Any]:
+async def get_api_mode() -> CodecJSONResponse:
     """Get current API mode configuration."""
-    return {
-        "mode": API_MODE,
-        "realtime_available": bool(REALTIME_SESSION_URL and AZURE_API_KEY),
-        "voicelive_available": bool(voice_live_client),
-        "voice": DEFAULT_VOICE if API_MODE == "realtime" else VOICE_LIVE_VOICE,
-    }
+    return _API_MODE_RESPONSES.get(API_MODE) or _api_mode_response(API_MODE)
 
 
 @app.post("/api/mode")
-async def set_api_mode(request: ApiModeRequest) -> Dict[str, Any]:
+async def set_api_mode(request: ApiModeRequest) -> CodecJSONResponse:
     """Change API mode dynamically."""
     global API_MODE
     
@@ -209,40 +306,39 @@ async def set_api_mode(request: ApiModeRequest) -> Dict[str, Any]:
     if mode not in ["realtime", "voicelive"]:
         raise HTTPException(status_code=400, detail="Mode must be 'realtime' or 'voicelive'")
     
-    if mode == "voicelive" and not voice_live_client:
+    if mode == "voicelive" and not VOICELIVE_AVAILABLE:
         raise HTTPException(status_code=400, detail="Voice Live API not configured")
     
-    if mode == "realtime" and not (REALTIME_SESSION_URL and AZURE_API_KEY):
+    if mode == "realtime" and not REALTIME_AVAILABLE:
         raise HTTPException(status_code=400, detail="GPT Realtime API not configured")
     
     API_MODE = mode
     logger.info(f"API mode changed to: {mode}")
     
-    return {
-        "mode": API_MODE,
-        "realtime_available": bool(REALTIME_SESSION_URL and AZURE_API_KEY),
-        "voicelive_available": bool(voice_live_client),
-        "voice": DEFAULT_VOICE if API_MODE == "realtime" else VOICE_LIVE_VOICE,
-    }
+    return _API_MODE_RESPONSES[mode]
 
 
 # ============================================================================
 # Spark Framework Key-Value Storage Endpoints
 # ============================================================================
 
+# Constant acknowledgement shared by the loaded/health endpoints; the body is rendered once here
+_STATUS_OK_RESPONSE = CodecJSONResponse({"status": "ok"})
+
+
 @app.post("/_spark/loaded")
-async def spark_loaded() -> Dict[str, str]:
+async def spark_loaded() -> CodecJSONResponse:
     """Handle Spark framework loaded event."""
-    return {"status": "ok"}
+    return _STATUS_OK_RESPONSE
 
 
 @app.get("/_spark/kv/{key}")
-async def spark_get_kv(key: str) -> Any:
+async def spark_get_kv(key: str) -> Response:
     """Get value from Spark key-value store."""
     if key not in spark_kv_store:
         raise HTTPException(status_code=404, detail=f"Key '{key}' not found")
     # Return the value directly, not wrapped
-    return spark_kv_store[key]
+    return Response(content=spark_kv_store[key], media_type="application/json")
 
 
 @app.post("/_spark/kv/{key}")
@@ -250,25 +346,24 @@ async def spark_set_kv(key: str, request: Request) -> Dict[str, str]:
     """Set value in Spark key-value store."""
     # Parse the request body as JSON
     try:
-        body = await request.json()
+        body = json_codec.loads(await request.body())
         # Spark typically sends the value directly or wrapped in {"value": ...}
         if isinstance(body, dict) and "value" in body:
             value = body["value"]
         else:
             value = body
-    except:
+    except json_codec.JSONDecodeError:
         # If parsing fails, just store None
         value = None
     
-    spark_kv_store[key] = value
+    spark_kv_store[key] = json_codec.dumps(value)
     return {"status": "ok", "key": key}
 
 
 @app.delete("/_spark/kv/{key}")
 async def spark_delete_kv(key: str) -> Dict[str, str]:
     """Delete key from Spark key-value store."""
-    if key in spark_kv_store:
-        del spark_kv_store[key]
+    spark_kv_store.pop(key, None)
     return {"status": "ok"}
 
 
@@ -284,17 +379,13 @@ async def get_voicelive_config() -> Dict[str, Any]:
     
     # Return backend proxy URL (without /api prefix since frontend adds it)
     # Use gpt-4o (text-only) instead of gpt-4o-realtime-preview to force Azure TTS for proper pt-PT
-    model = os.getenv("VOICE_LIVE_MODEL", "gpt-4o")
-    
-    # Use Azure HD voice for better SSML support with pt-PT language
-    voice_env = os.getenv("VOICE_LIVE_VOICE", "en-US-Ava:DragonHDLatestNeural")
     return {
         "endpoint": "/voicelive/ws",  # Frontend will prepend /api via backendBaseUrl
-        "model": model,
-        "voice": voice_env,
+        "model": VOICE_LIVE_MODEL,
+        "voice": VOICE_LIVE_CONFIG_VOICE,
         "language": "pt-PT",
-        "temperature": float(os.getenv("VOICE_LIVE_TEMPERATURE", "0.8")),
-        "rate": os.getenv("VOICE_LIVE_RATE", "1.0"),
+        "temperature": VOICE_LIVE_TEMPERATURE,
+        "rate": VOICE_LIVE_RATE,
     }
 
 
@@ -307,10 +398,9 @@ async def voicelive_websocket_proxy(websocket: WebSocket):
         await websocket.close(code=1008, reason="Voice Live API not configured")
         return
     
-    # Construct Azure WebSocket URL with authentication
-    # Use gpt-4o (text-only) to force Azure TTS for proper pt-PT pronunciation
-    model = os.getenv("VOICE_LIVE_MODEL", "gpt-4o")
-    azure_ws_url = f"{VOICE_LIVE_ENDPOINT}&model={model}"
+    # Azure WebSocket URL is built once at startup from VOICE_LIVE_MODEL
+    # (gpt-4o, text-only, forces Azure TTS for proper pt-PT pronunciation)
+    azure_ws_url = VOICE_LIVE_WS_URL
     
     # Add API key as header
     headers = {
@@ -322,41 +412,89 @@ async def voicelive_websocket_proxy(websocket: WebSocket):
     
     try:
         # Connect to Azure Voice Live API
-        async with websockets.connect(azure_ws_url, additional_headers=headers) as azure_ws:
+        # Audio is base64 text or raw PCM16, neither of which deflates usefully, so skip
+        # permessage-deflate; lift the size cap so large audio deltas are never rejected
+        async with websockets.connect(
+            azure_ws_url,
+            additional_headers=headers,
+            compression=None,
+            ping_interval=20,
+            ping_timeout=20,
+            max_size=None,
+            max_queue=128,
+            write_limit=2**17,
+        ) as azure_ws:
             logger.info("Connected to Azure Voice Live API")
             
             # Create bidirectional relay
             async def relay_to_azure():
-                """Relay messages from frontend to Azure."""
+                """Relay messages from frontend to Azure, coalescing audio frames that queue up."""
+                inbox: asyncio.Queue = asyncio.Queue(maxsize=RELAY_INBOX_MAX_MESSAGES)
+
+                async def read_frontend():
+                    # Read ahead so audio frames that arrive while Azure is draining can be batched
+                    try:
+                        while True:
+                            message = await websocket.receive()
+                            await inbox.put(message)
+                            if message["type"] == "websocket.disconnect":
+                                return
+                    except Exception as exc:
+                        await inbox.put(exc)
+
+                async def flush_audio(pending_audio: bytearray):
+                    # Base64 encode the PCM16 audio and join it into the envelope in a single
+                    # allocation; the ASCII bytes never need a str round trip
+                    audio_event = b"".join((
+                        _AUDIO_APPEND_PREFIX,
+                        binascii.b2a_base64(pending_audio, newline=False),
+                        _AUDIO_APPEND_SUFFIX,
+                    ))
+                    pending_audio.clear()
+                    await azure_ws.send(audio_event, text=True)
+
+                reader = asyncio.create_task(read_frontend())
+                pending_audio = bytearray()
                 try:
                     while True:
-                        # Receive either text or binary data
-                        message = await websocket.receive()
-                        
-                        if "text" in message:
-                            data = message["text"]
-                            logger.info(f"Frontend -> Azure (text): {data[:200]}...")
-                            await azure_ws.send(data)
-                        elif "bytes" in message:
-                            # For binary audio data, we need to wrap it in input_audio_buffer.append event
-                            audio_data = message["bytes"]
-                            # Base64 encode the PCM16 audio
-                            import base64
-                            audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-                            audio_event = {
-                                "type": "input_audio_buffer.append",
-                                "audio": audio_base64
-                            }
-                            # logger.info(f"Frontend -> Azure (audio event): {len(audio_data)} bytes")
-                            await azure_ws.send(json.dumps(audio_event))
+                        message = await inbox.get()
+                        # Drain whatever is already queued, sending text in order and
+                        # batching consecutive audio into one input_audio_buffer.append
+                        while True:
+                            if isinstance(message, Exception):
+                                raise message
+                            if message["type"] == "websocket.disconnect":
+                                if pending_audio:
+                                    await flush_audio(pending_audio)
+                                raise WebSocketDisconnect(message.get("code", 1000))
+
+                            if "text" in message:
+                                if pending_audio:
+                                    await flush_audio(pending_audio)
+                                data = message["text"]
+                                if logger.isEnabledFor(logging.INFO):
+                                    logger.info("Frontend -> Azure (text): %.200s...", data)
+                                await azure_ws.send(data)
+                            elif "bytes" in message:
+                                # For binary audio data, we need to wrap it in input_audio_buffer.append event
+                                pending_audio += message["bytes"]
+
+                            if len(pending_audio) >= AUDIO_BATCH_MAX_BYTES or inbox.empty():
+                                break
+                            message = inbox.get_nowait()
+
+                        if pending_audio:
+                            # logger.info(f"Frontend -> Azure (audio event): {len(pending_audio)} bytes")
+                            await flush_audio(pending_audio)
                 except WebSocketDisconnect:
                     logger.info("Frontend disconnected")
                 except (ConnectionClosedError, ConnectionClosedOK) as e:
                     logger.info(f"Azure WebSocket closed: {e}")
                 except Exception as e:
                     logger.error(f"Error relaying to Azure: {e}")
-                    import traceback
                     logger.error(traceback.format_exc())
+                finally:
+                    reader.cancel()
             
             async def relay_to_frontend():
                 """Relay messages from Azure to frontend."""
@@ -364,48 +502,64 @@ async def voicelive_websocket_proxy(websocket: WebSocket):
                     async for message in azure_ws:
                         if isinstance(message, bytes):
                             # Binary audio from Azure - send directly to frontend
-                            logger.info(f"Azure -> Frontend (binary): {len(message)} bytes")
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Azure -> Frontend (binary): %d bytes", len(message))
                             await websocket.send_bytes(message)
                         else:
                             # Text message from Azure
-                            logger.info(f"Azure -> Frontend (text): {str(message)[:200]}...")
-                            # Check if it's an audio response that needs extraction
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info("Azure -> Frontend (text): %.200s...", message)
+                            # Only audio deltas need extraction; forward everything else untouched
+                            # without paying for a JSON parse
+                            if "audio.delta" not in message:
+                                await websocket.send_text(message)
+                                continue
                             try:
-                                msg_json = json.loads(message)
-                                msg_type = msg_json.get("type", "")
-                                
-                                # Handle both legacy and new audio delta event names
-                                if msg_type in ("response.audio.delta", "response.output_audio.delta"):
-                                    # Some APIs send base64 in 'delta', others in 'audio'
-                                    audio_base64 = msg_json.get("delta") or msg_json.get("audio", "")
-                                    if audio_base64:
-                                        import base64
-                                        audio_bytes = base64.b64decode(audio_base64)
-                                        logger.info(f"Extracted {len(audio_bytes)} bytes from {msg_type}")
-                                        await websocket.send_bytes(audio_bytes)
-                                    # Strip audio payload from JSON to avoid forwarding huge blobs
-                                    msg_json["delta"] = ""
-                                    msg_json["audio"] = ""
-                                    await websocket.send_text(json.dumps(msg_json))
-                                else:
-                                    # For non-audio messages, send as-is
-                                    await websocket.send_text(message)
-                            except json.JSONDecodeError:
+                                msg_json = json_codec.loads(message)
+                            except json_codec.JSONDecodeError:
                                 # Not JSON, send as-is
                                 await websocket.send_text(message)
+                                continue
+                            msg_type = msg_json.get("type", "")
+
+                            # Handle both legacy and new audio delta event names
+                            if msg_type in ("response.audio.delta", "response.output_audio.delta"):
+                                # Some APIs send base64 in 'delta', others in 'audio'
+                                audio_base64 = msg_json.get("delta") or msg_json.get("audio", "")
+                                if audio_base64:
+                                    audio_bytes = base64.b64decode(audio_base64)
+                                    if logger.isEnabledFor(logging.INFO):
+                                        logger.info("Extracted %d bytes from %s", len(audio_bytes), msg_type)
+                                    await websocket.send_bytes(audio_bytes)
+                                # Forward only the event envelope; the audio payload went out as bytes
+                                await websocket.send_text(json_codec.dumps_str({
+                                    "type": msg_type,
+                                    "event_id": msg_json.get("event_id"),
+                                    "response_id": msg_json.get("response_id"),
+                                    "item_id": msg_json.get("item_id"),
+                                    "output_index": msg_json.get("output_index"),
+                                    "content_index": msg_json.get("content_index"),
+                                    "delta": "",
+                                    "audio": "",
+                                }))
+                            else:
+                                # For non-audio messages, send as-is
+                                await websocket.send_text(message)
                 except (ConnectionClosedError, ConnectionClosedOK) as e:
                     logger.info(f"Azure WebSocket closed: {e}")
                 except Exception as e:
                     logger.error(f"Error relaying to frontend: {e}")
-                    import traceback
                     logger.error(traceback.format_exc())
             
-            # Run both relay tasks concurrently
-            await asyncio.gather(
-                relay_to_azure(),
-                relay_to_frontend(),
-                return_exceptions=True
-            )
+            # Run both relays and tear the other one down as soon as either side closes
+            relay_tasks = {
+                asyncio.create_task(relay_to_azure()),
+                asyncio.create_task(relay_to_frontend()),
+            }
+            _, pending = await asyncio.wait(relay_tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
     except Exception as e:
         logger.error(f"Voice Live WebSocket proxy error: {e}")
@@ -451,13 +605,17 @@ async def synthesize_speech(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+# The registry is static after import, so the /api/tools payload is serialized exactly once
+_TOOLS_JSON = json_codec.dumps({
+    "tools": [tool["definition"] for tool in TOOLS_REGISTRY.values()],
+    "tool_choice": "auto",
+})
+
+
 @app.get("/api/tools")
-async def list_tools() -> Dict[str, Any]:
+async def list_tools() -> Response:
     """Return tool definitions for the frontend to register with the realtime session."""
-    return {
-        "tools": [tool["definition"] for tool in TOOLS_REGISTRY.values()],
-        "tool_choice": "auto",
-    }
+    return Response(content=_TOOLS_JSON, media_type="application/json")
 
 
 @app.post("/api/session", response_model=SessionResponse)
@@ -475,13 +633,13 @@ async def create_session(request: SessionRequest) -> SessionResponse:
     print("HEADERS:", headers)
     print("PAYLOAD:", payload)
     
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.post(REALTIME_SESSION_URL, headers=headers, json=payload)
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:  # pragma: no cover - network specific
-            logger.exception("Failed to create realtime session: %s", exc)
-            raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text)
+    client: httpx.AsyncClient = app.state.httpx
+    response = await client.post(REALTIME_SESSION_URL, headers=headers, json=payload)
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:  # pragma: no cover - network specific
+        logger.exception("Failed to create realtime session: %s", exc)
+        raise HTTPException(status_code=exc.response.status_code, detail=exc.response.text)
 
     data = response.json()
     ephemeral_key = data.get("client_secret", {}).get("value")
@@ -501,7 +659,7 @@ async def create_session(request: SessionRequest) -> SessionResponse:
 @app.post("/api/function-call", response_model=FunctionCallResponse)
 async def execute_function(request: FunctionCallRequest) -> FunctionCallResponse:
     """Execute a tool requested by the model, return its structured output, and
-    display a rich debug pane (if 'rich' is installed) with name, arguments, and result.
+    display a rich debug pane (when RICH_DEBUG=1) with name, arguments, and result.
     """
     tool = TOOLS_REGISTRY.get(request.name)
     if not tool:
@@ -511,66 +669,85 @@ async def execute_function(request: FunctionCallRequest) -> FunctionCallResponse
     executor: ToolExecutor = tool["executor"]
 
     result = executor(arguments)
-    if inspect.isawaitable(result):
-        result = await result
+    # Executors return either a plain dict or a coroutine; only fall back to the
+    # generic awaitable check for anything more exotic
+    if type(result) is not dict:
+        if asyncio.iscoroutine(result) or inspect.isawaitable(result):
+            result = await result
 
     if not isinstance(result, dict):
         raise HTTPException(status_code=500, detail="Function executor must return a dict")
 
-    # Rich debug output (best-effort; falls back silently if rich not available)
-    try:
-
-        console = Console()
-
-        table = Table.grid(padding=(0, 1))
-        table.add_column(justify="right", style="bold cyan")
-        table.add_column(style="white")
-
-        table.add_row("Function:", request.name)
-        table.add_row("Call ID:", request.call_id)
-
-        # Arguments block
-        try:
-            args_json = RichJSON.from_data(arguments)
-        except Exception:
-            args_json = str(arguments)
-
-        # Result block
+    # Rich debug output (opt-in; rendering errors never affect the API response)
+    if RICH_DEBUG:
         try:
-            result_json = RichJSON.from_data(result)
-        except Exception:
-            result_json = str(result)
-
-        console.print(
-            Panel.fit(
-                table,
-                title="Function Call",
-                border_style="magenta",
+            table = Table.grid(padding=(0, 1))
+            table.add_column(justify="right", style="bold cyan")
+            table.add_column(style="white")
+
+            table.add_row("Function:", request.name)
+            table.add_row("Call ID:", request.call_id)
+
+            # Arguments block
+            try:
+                args_json = RichJSON.from_data(arguments)
+            except Exception:
+                args_json = str(arguments)
+
+            # Result block
+            try:
+                result_json = RichJSON.from_data(result)
+            except Exception:
+                result_json = str(result)
+
+            _rich_console.print(
+                Panel.fit(
+                    table,
+                    title="Function Call",
+                    border_style="magenta",
+                )
             )
-        )
-        console.print(Panel(args_json, title="Arguments", border_style="cyan"))
-        console.print(Panel(result_json, title="Result", border_style="green"))
-    except Exception as e:
-        # Swallow any rich / rendering errors to avoid impacting API behavior
-        console.print(f"Exception: {e}")
+            _rich_console.print(Panel(args_json, title="Arguments", border_style="cyan"))
+            _rich_console.print(Panel(result_json, title="Result", border_style="green"))
+        except Exception as e:
+            # Swallow any rich / rendering errors to avoid impacting API behavior
+            _rich_console.print(f"Exception: {e}")
 
     return FunctionCallResponse(call_id=request.call_id, output=result)
 
 
 @app.get("/healthz")
-async def healthcheck() -> Dict[str, str]:
-    return {"status": "ok"}
+async def healthcheck() -> CodecJSONResponse:
+    return _STATUS_OK_RESPONSE
+
+
+# The runtime config only depends on startup env, so the script is rendered once
+_RUNTIME_CONFIG_PAYLOAD = json_codec.dumps_str({"backendBaseUrl": FRONTEND_BACKEND_BASE_URL})
+_RUNTIME_CONFIG_RESPONSE = PlainTextResponse(
+    content=f"window.__APP_CONFIG__ = Object.freeze({_RUNTIME_CONFIG_PAYLOAD});",
+    media_type="application/javascript",
+)
 
 
 @app.get("/runtime-config.js", response_class=PlainTextResponse)
 async def runtime_config() -> PlainTextResponse:
-    payload = json.dumps({"backendBaseUrl": FRONTEND_BACKEND_BASE_URL})
-    script = f"window.__APP_CONFIG__ = Object.freeze({payload});"
-    return PlainTextResponse(content=script, media_type="application/javascript")
+    return _RUNTIME_CONFIG_RESPONSE
+
+
+@app.on_event("startup")
+async def startup_event() -> None:
+    # One pooled client for all outbound REST calls so connections and TLS sessions are reused
+    app.state.httpx = httpx.AsyncClient(
+        timeout=httpx.Timeout(15.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    await app.state.httpx.aclose()
+    if voice_live_client:
+        await voice_live_client.aclose()
     await credential.close()
 
 
@@ -587,24 +764,46 @@ except ImportError as e:
 
 
 if FRONTEND_DIST_DIR.exists():
-    # Note: StaticFiles mounted at "/" must come AFTER all API route decorators
-    # However, it can still catch WebSocket connections in some Starlette versions
-    # To fix this, we mount static files more carefully
-    from starlette.routing import Mount, Route
-    from starlette.responses import FileResponse
-    
-    @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
-        """Serve frontend files, but let API routes take precedence."""
-        # This route has lower priority than explicit routes above
-        if full_path == "" or full_path == "index.html":
-            return FileResponse(FRONTEND_DIST_DIR / "index.html")
-        
-        file_path = FRONTEND_DIST_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        
-        # For client-side routing, serve index.html for unknown paths
-        return FileResponse(FRONTEND_DIST_DIR / "index.html")
+    # StaticFiles mounted at "/" must come AFTER all API routes so they take precedence
+    from starlette.datastructures import Headers
+    from starlette.exceptions import HTTPException as StarletteHTTPException
+    from starlette.types import Receive, Scope, Send
+    from starlette.websockets import WebSocketClose
+
+    # index.html answers every SPA navigation, so keep it in memory instead of re-reading it from disk
+    _INDEX_BYTES = (FRONTEND_DIST_DIR / "index.html").read_bytes()
+    _INDEX_HEADERS = {
+        "ETag": f'"{hashlib.sha1(_INDEX_BYTES).hexdigest()}"',
+        "Cache-Control": "no-cache",
+    }
+
+    def _index_response(scope: Scope) -> Response:
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if _INDEX_HEADERS["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=_INDEX_HEADERS)
+        return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
+
+    class SPAStaticFiles(StaticFiles):
+        """Static files with ETag/304 handling that fall back to index.html for client-side routes."""
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            # Unknown WebSocket paths reach the "/" mount too; reject them instead of asserting
+            if scope["type"] != "http":
+                await WebSocketClose()(scope, receive, send)
+                return
+            await super().__call__(scope, receive, send)
+
+        async def get_response(self, path: str, scope: Scope) -> Response:
+            if path in (".", "index.html") and scope["method"] in ("GET", "HEAD"):
+                return _index_response(scope)
+            try:
+                return await super().get_response(path, scope)
+            except StarletteHTTPException as exc:
+                if exc.status_code != 404:
+                    raise
+            # For client-side routing, serve index.html for unknown paths
+            return _index_response(scope)
+
+    app.mount("/", SPAStaticFiles(directory=str(FRONTEND_DIST_DIR), html=True), name="frontend")
 else:
     logger.warning("Frontend build directory not found at %s; React app will not be served.", FRONTEND_DIST_DIR)
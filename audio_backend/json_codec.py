@@ -0,0 +1,45 @@
+"""JSON encode/decode helpers for the realtime relay paths.
+
+Uses orjson when it is installed and falls back to the stdlib encoder otherwise,
+so callers get the fast path without having to care which one is available.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+HAS_ORJSON = orjson is not None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    # Match the stdlib encoder, which turns int/float/bool/None dict keys into strings
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def dumps_str(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+else:  # pragma: no cover - stdlib fallback
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def dumps_str(obj: Any) -> str:
+        """Serialize ``obj`` to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
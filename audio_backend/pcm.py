@@ -0,0 +1,77 @@
+"""PCM conversion helpers for audio sent to the realtime APIs.
+
+Uses numpy when it is installed and falls back to the stdlib ``array`` module
+otherwise; the fallback converts sample by sample in Python, which is fine for
+occasional use but not for a sustained stream.
+"""
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - stdlib fallback
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Sample rate of "pcm16" audio on the Realtime and Voice Live APIs
+PCM16_SAMPLE_RATE = 24000
+
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+if np is not None:
+
+    def float32_to_pcm16(samples: Any, src_rate: int = PCM16_SAMPLE_RATE, dst_rate: int = PCM16_SAMPLE_RATE) -> bytes:
+        """
+        Convert float32 samples in [-1.0, 1.0] to little-endian PCM16 bytes.
+
+        ``samples`` is a numpy array, a sequence of floats, or raw native-endian
+        float32 bytes. Audio at another rate is linearly resampled to
+        ``dst_rate`` in the same pass; each call is resampled on its own, so
+        keep chunks a whole number of resampling periods long.
+        """
+        if isinstance(samples, _BYTES_LIKE):
+            x = np.frombuffer(samples, dtype=np.float32)
+        else:
+            x = np.asarray(samples, dtype=np.float32)
+        if src_rate != dst_rate and len(x):
+            n_out = len(x) * dst_rate // src_rate
+            x = np.interp(np.arange(n_out) * (src_rate / dst_rate), np.arange(len(x)), x)
+        return np.clip(x * 32767.0, -32768.0, 32767.0).astype("<i2").tobytes()
+
+else:  # pragma: no cover - stdlib fallback
+
+    def float32_to_pcm16(samples: Any, src_rate: int = PCM16_SAMPLE_RATE, dst_rate: int = PCM16_SAMPLE_RATE) -> bytes:
+        """
+        Convert float32 samples in [-1.0, 1.0] to little-endian PCM16 bytes.
+
+        ``samples`` is a sequence of floats or raw native-endian float32 bytes.
+        Audio at another rate is linearly resampled to ``dst_rate``; each call
+        is resampled on its own, so keep chunks a whole number of resampling
+        periods long.
+        """
+        x = array("f")
+        if isinstance(samples, _BYTES_LIKE):
+            x.frombytes(samples)
+        else:
+            x.extend(samples)
+        n = len(x)
+        if src_rate != dst_rate and n:
+            step = src_rate / dst_rate
+            resampled = []
+            for i in range(n * dst_rate // src_rate):
+                pos = i * step
+                k = int(pos)
+                if k + 1 < n:
+                    resampled.append(x[k] + (x[k + 1] - x[k]) * (pos - k))
+                else:
+                    resampled.append(x[n - 1])
+            x = resampled
+        out = array("h", [int(max(-32768.0, min(32767.0, v * 32767.0))) for v in x])
+        if sys.byteorder == "big":
+            out.byteswap()
+        return out.tobytes()
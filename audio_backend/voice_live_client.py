@@ -7,11 +7,29 @@ from __future__ import annotations
 
 import httpx
 import logging
+import time
 from typing import Optional, Dict, Any
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# The Azure voice catalog changes rarely, so voice lists are reused for this long
+VOICES_CACHE_TTL_SECONDS = 3600
+# Upper bound on cached per-language filtered lists; the language comes from a query parameter
+VOICES_CACHE_MAX_LANGUAGES = 32
+
+# Voice and language are fixed for Azure TTS, so only the escaped text varies between requests
+_SSML_PREFIX = '''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="pt-PT">
+  <voice name="en-US-AvaMultilingualNeural">
+    <lang xml:lang="pt-PT">
+      <mstts:express-as style="general">
+        <prosody rate="0%" pitch="+0st">'''
+_SSML_SUFFIX = '''</prosody>
+      </mstts:express-as>
+    </lang>
+  </voice>
+</speak>'''
+
 
 class SSMLVoice(str, Enum):
     """Supported SSML voice for Azure TTS (enforced)"""
@@ -21,6 +39,14 @@ class SSMLVoice(str, Enum):
 class SSMLGenerator:
     """Generate SSML markup for Azure TTS"""
     
+    _XML_ESCAPE = str.maketrans({
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&apos;",
+    })
+    
     @staticmethod
     def generate_ssml(
         text: str,
@@ -32,22 +58,9 @@ class SSMLGenerator:
         """
         Generate SSML markup for text-to-speech. Always uses en-US-AvaMultilingualNeural and pt-PT.
         """
-        # Escape XML special characters
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-        text = text.replace('"', "&quot;")
-        text = text.replace("'", "&apos;")
-        ssml = f'''<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="pt-PT">
-  <voice name="en-US-AvaMultilingualNeural">
-    <lang xml:lang="pt-PT">
-      <mstts:express-as style="general">
-        <prosody rate="0%" pitch="+0st">{text}</prosody>
-      </mstts:express-as>
-    </lang>
-  </voice>
-</speak>'''
-        return ssml
+        # Escape XML special characters in a single pass
+        text = text.translate(SSMLGenerator._XML_ESCAPE)
+        return _SSML_PREFIX + text + _SSML_SUFFIX
     
     @staticmethod
     def add_emphasis(text: str, level: str = "moderate") -> str:
@@ -73,7 +86,8 @@ class VoiceLiveClient:
         endpoint: str,
         api_key: str,
         deployment: str = "tts-model",
-        default_voice: str = "en-US-AvaMultilingualNeural"
+        default_voice: str = "en-US-AvaMultilingualNeural",
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Voice Live API client.
@@ -83,12 +97,29 @@ class VoiceLiveClient:
             api_key: API key for authentication
             deployment: Deployment name
             default_voice: Default voice to use
+            http_client: Shared HTTP client to reuse (created lazily if not provided)
         """
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
         self.deployment = deployment
         self.default_voice = default_voice
         self.ssml_generator = SSMLGenerator()
+        self._client = http_client
+        self._owns_client = http_client is None
+        # language (None = unfiltered) -> (voices, monotonic expiry)
+        self._voices_cache: dict[str | None, tuple[list[Dict[str, Any]], float]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
     
     async def synthesize_speech(
         self,
@@ -133,10 +164,9 @@ class VoiceLiveClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, content=ssml_text)
-                response.raise_for_status()
-                return response.content
+            response = await self._get_client().post(url, headers=headers, content=ssml_text, timeout=30.0)
+            response.raise_for_status()
+            return response.content
         except httpx.HTTPError as exc:
             logger.error(f"Voice Live API error: {exc}")
             raise
@@ -151,22 +181,38 @@ class VoiceLiveClient:
         Returns:
             List of voice metadata
         """
-        url = f"{self.endpoint}/cognitiveservices/voices/list"
+        now = time.monotonic()
+        entry = self._voices_cache.get(language)
+        if entry and entry[1] > now:
+            return entry[0]
         
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.api_key
-        }
-        
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, headers=headers)
+        # Language-specific lists are filtered from the cached full catalog
+        entry = self._voices_cache.get(None)
+        if entry and entry[1] > now:
+            voices, expires_at = entry
+        else:
+            url = f"{self.endpoint}/cognitiveservices/voices/list"
+            
+            headers = {
+                "Ocp-Apim-Subscription-Key": self.api_key
+            }
+            
+            try:
+                response = await self._get_client().get(url, headers=headers, timeout=10.0)
                 response.raise_for_status()
                 voices = response.json()
-                
-                if language:
-                    voices = [v for v in voices if v.get("Locale", "").startswith(language)]
-                
-                return voices
-        except httpx.HTTPError as exc:
-            logger.error(f"Failed to get voices: {exc}")
-            return []
+            except httpx.HTTPError as exc:
+                logger.error(f"Failed to get voices: {exc}")
+                return []
+            
+            expires_at = now + VOICES_CACHE_TTL_SECONDS
+            # A fresh catalog invalidates every filtered list derived from the old one
+            self._voices_cache = {None: (voices, expires_at)}
+        
+        if language:
+            voices = [v for v in voices if v.get("Locale", "").startswith(language)]
+            # Past the cap, filter per request instead of letting arbitrary strings grow the cache
+            if len(self._voices_cache) <= VOICES_CACHE_MAX_LANGUAGES:
+                self._voices_cache[language] = (voices, expires_at)
+        
+        return voices
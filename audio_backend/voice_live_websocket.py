@@ -5,17 +5,150 @@ Voice Live API is an enhanced version of OpenAI Realtime API with Azure-specific
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
-from typing import Optional, Dict, Any, Callable, Awaitable
+import ssl
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Callable, Awaitable, AsyncIterable, Union, TypedDict
 import asyncio
+import aiohttp
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
+
+import json_codec
+import pcm
 
 logger = logging.getLogger(__name__)
 
 
+class ServerEvent(TypedDict, total=False):
+    """A decoded server event; fields other than type and event_id vary by event type."""
+    type: str
+    event_id: str
+
+
+class AudioDataEvent(TypedDict):
+    """Binary audio frame wrapped for callback when no on_audio handler is given."""
+    type: str  # always "audio.data"
+    audio: bytes
+
+
+EventHandler = Callable[[ServerEvent], Awaitable[None]]
+
+
+# End-of-iterator marker for _json_size_exceeds
+_END = object()
+
+
+def _json_size_exceeds(obj: Any, budget: int) -> bool:
+    """
+    Return True if obj's encoded size is estimated to exceed budget bytes.
+    
+    Walks nested dicts and lists, counting strings by length and anything else
+    as a few bytes, and stops as soon as the budget is spent, so the check costs
+    at most O(budget) however large the object is.
+    """
+    # Iterators rather than items, so a huge list isn't copied before the budget runs out
+    stack = [iter((obj,))]
+    while stack:
+        item = next(stack[-1], _END)
+        if item is _END:
+            stack.pop()
+            continue
+        if isinstance(item, (str, bytes)):
+            budget -= len(item)
+        elif isinstance(item, dict):
+            budget -= 2 + 6 * len(item)
+            for key in item:
+                if isinstance(key, str):
+                    budget -= len(key)
+                if budget < 0:
+                    return True
+            stack.append(iter(item.values()))
+        elif isinstance(item, (list, tuple)):
+            budget -= 2
+            stack.append(iter(item))
+        else:
+            budget -= 8
+        if budget < 0:
+            return True
+    return False
+
+
+def _encode_function_call_output(call_id: str, output: Any) -> str:
+    """Serialize the conversation.item.create event carrying a function call result."""
+    return json_codec.dumps_str({
+        "type": "conversation.item.create",
+        "item": {
+            "type": "function_call_output",
+            "call_id": call_id,
+            "output": json_codec.dumps_str(output)
+        }
+    })
+
+
+# Placeholder for the instructions value in the pre-serialized session.update template
+_INSTRUCTIONS_SENTINEL = "__INSTRUCTIONS__"
+
+# Sent after every text/function-call item; kept as str so it goes out as a text frame
+_RESPONSE_CREATE = '{"type":"response.create"}'
+
+# Outgoing PCM16 chunks are coalesced for up to this long before being sent as one frame
+AUDIO_FLUSH_INTERVAL_SECONDS = 0.04
+# ...or until this much audio is buffered (100 ms of 24 kHz PCM16)
+AUDIO_FLUSH_MAX_BYTES = 4800
+
+# Largest incoming message accepted from the service
+MAX_MESSAGE_BYTES = 10 * 1024 * 1024
+
+# What a send raises once the connection is gone: websockets raises ConnectionClosed,
+# aiohttp a ConnectionResetError subclass
+_CONNECTION_CLOSED_ERRORS = (websockets.exceptions.ConnectionClosed, ConnectionError)
+
+# Outgoing frames waiting for the writer task; senders wait only once this many are queued
+SEND_QUEUE_MAX_FRAMES = 256
+# Longest disconnect() waits for queued frames to be written before closing anyway;
+# matches the transports' own close timeout
+CLOSE_TIMEOUT_SECONDS = 10
+
+# Tool outputs estimated above this size are JSON-encoded in a worker thread
+LARGE_TOOL_OUTPUT_BYTES = 64 * 1024
+
+# Keepalive: ping every interval, drop the connection after this many unanswered pings
+HEARTBEAT_INTERVAL_SECONDS = 25
+HEARTBEAT_TIMEOUT_SECONDS = 10
+HEARTBEAT_MAX_MISSES = 2
+
+# Process-wide aiohttp session used by VoiceLiveAiohttpClient, created on first connect
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it if needed.
+    
+    Reusing one session (and its SSL context and DNS cache) across clients and
+    reconnects avoids rebuilding the trust store and re-resolving the host on
+    every connect.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+        ssl_context = ssl.create_default_context()
+        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, ssl=ssl_context)
+        _SHARED_SESSION = aiohttp.ClientSession(connector=connector)
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the shared aiohttp session; call on application shutdown."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None:
+        await _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+
+
 class VoiceLiveWebSocketClient:
     """WebSocket client for Azure Voice Live API conversational AI"""
     
@@ -45,9 +178,136 @@ class VoiceLiveWebSocketClient:
         self.voice = voice
         self.temperature = temperature
         self.rate = rate
-        self.websocket: Optional[WebSocketClientProtocol] = None
+        # Connection URL and headers are fixed for the client's lifetime; build them once
+        self._connection_url = f"{endpoint}&model={model}"
+        self._headers = {"api-key": api_key}
+        self.websocket: Optional[ClientConnection] = None
         self.is_connected = False
+        # (formats, turn detection, voice settings) -> serialized session.update halves
+        self._session_templates: Dict[tuple, tuple[str, str]] = {}
+        # (instructions, JSON-encoded instructions) from the last session.update
+        self._instructions_json: Optional[tuple[str, str]] = None
+        self._audio_buf = bytearray()
+        self._audio_flush_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        # Outgoing frames (str -> text, bytes-like -> binary) and the task writing them, per connection
+        self._send_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Senders waiting for room in the queue line up on this lock (FIFO), and nobody
+        # takes the put_nowait fast path while any are waiting, so frames keep call order
+        self._enqueue_lock = asyncio.Lock()
+        self._enqueue_waiters = 0
+        # Recent ping round-trip times in seconds, newest last
+        self.rtt_samples: deque[float] = deque(maxlen=32)
+        
+    def _set_connected(self, connected: bool) -> None:
+        """Update connection state and swap send_audio to the matching implementation."""
+        self.is_connected = connected
+        if connected:
+            self.send_audio = self._send_audio_connected
+            self._bind_send()
+            self._send_q = asyncio.Queue(maxsize=SEND_QUEUE_MAX_FRAMES)
+            self._writer_task = asyncio.create_task(self._writer_loop(self._send_q))
+            if self._use_heartbeat:
+                self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        else:
+            # Drop the instance overrides so the class-level implementations apply
+            self.__dict__.pop("send_audio", None)
+            self.__dict__.pop("_send_str", None)
+            self.__dict__.pop("_send_bytes", None)
+            if self._audio_flush_task is not None:
+                self._audio_flush_task.cancel()
+                self._audio_flush_task = None
+            self._audio_buf.clear()
+            task = self._heartbeat_task
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+            self._heartbeat_task = None
+            task = self._writer_task
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+            self._writer_task = None
+            # Discard unsent frames so anyone waiting in flush() is released
+            send_q = self._send_q
+            self._send_q = None
+            if send_q is not None:
+                self._drain_queue(send_q)
+    
+    @staticmethod
+    def _drain_queue(send_q: asyncio.Queue) -> None:
+        while not send_q.empty():
+            send_q.get_nowait()
+            send_q.task_done()
+    
+    async def _enqueue(self, frame: Union[str, bytes, bytearray]) -> bool:
+        """
+        Queue a frame for the writer task; waits only when the queue is full.
+        
+        Returns:
+            True if queued, False if the connection is gone (including when it
+            closed while waiting for room)
+        """
+        send_q = self._send_q
+        if send_q is None:
+            return False
+        if not self._enqueue_waiters:
+            try:
+                send_q.put_nowait(frame)
+                return True
+            except asyncio.QueueFull:
+                pass
         
+        self._enqueue_waiters += 1
+        try:
+            async with self._enqueue_lock:
+                await send_q.put(frame)
+        finally:
+            self._enqueue_waiters -= 1
+        if send_q is not self._send_q:
+            # Disconnected while waiting; nothing drains this queue any more
+            self._drain_queue(send_q)
+            return False
+        return True
+    
+    async def _writer_loop(self, send_q: asyncio.Queue) -> None:
+        """
+        Write queued frames to the socket in order.
+        
+        This is the only task that writes frames, so callers never wait on
+        socket writability and a send failure is handled here, once.
+        """
+        try:
+            while True:
+                frame = await send_q.get()
+                try:
+                    if type(frame) is str:
+                        await self._send_str(frame)
+                    else:
+                        await self._send_bytes(frame)
+                finally:
+                    send_q.task_done()
+        except _CONNECTION_CLOSED_ERRORS as e:
+            logger.info("Voice Live WebSocket connection closed while sending: %s", e)
+            self._set_connected(False)
+        except Exception as e:
+            logger.error("Failed to send to Voice Live API: %s", e)
+            self._set_connected(False)
+    
+    async def flush(self) -> bool:
+        """
+        Wait until everything sent so far, including buffered audio, is written.
+        
+        Returns:
+            True if the connection is still up afterwards, False otherwise
+        """
+        if not self.is_connected:
+            return False
+        await self._flush_audio()
+        send_q = self._send_q
+        if send_q is not None:
+            await send_q.join()
+        return self.is_connected
+    
     async def connect(self) -> bool:
         """
         Establish WebSocket connection to Voice Live API.
@@ -55,65 +315,106 @@ class VoiceLiveWebSocketClient:
         Returns:
             True if connection successful, False otherwise
         """
+        if self.is_connected:
+            # Reconnecting: close the old socket and stop its writer and heartbeat first.
+            # The old link is usually the reason for reconnecting, so don't wait on its queue.
+            await self.disconnect(flush=False)
         try:
-            # Add model parameter to endpoint
-            connection_url = f"{self.endpoint}&model={self.model}"
-            
-            # Connect with API key authentication
-            headers = {
-                "api-key": self.api_key
-            }
-            
-            logger.info(f"Connecting to Voice Live API: {connection_url}")
+            logger.info("Connecting to Voice Live API: %s", self._connection_url)
             self.websocket = await websockets.connect(
-                connection_url,
-                extra_headers=headers,
-                max_size=10 * 1024 * 1024,  # 10MB max message size
-                ping_interval=20,
-                ping_timeout=10,
+                self._connection_url,
+                additional_headers=self._headers,
+                compression=None,  # PCM16 audio doesn't compress; skip the per-frame zlib pass
+                max_size=MAX_MESSAGE_BYTES,
+                ping_interval=None,  # keepalive is handled by _heartbeat
             )
             
-            self.is_connected = True
+            self._set_connected(True)
             logger.info("Voice Live WebSocket connection established")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to Voice Live API: {e}")
-            self.is_connected = False
+            logger.error("Failed to connect to Voice Live API: %s", e)
+            self._set_connected(False)
             return False
     
-    async def send_session_update(
-        self,
-        instructions: str,
-        tools: Optional[list] = None,
-        tool_choice: str = "auto",
-        input_audio_format: str = "pcm16",
-        output_audio_format: str = "pcm16",
-        turn_detection_type: str = "azure_semantic_vad",
-    ) -> bool:
+    @property
+    def last_rtt(self) -> Optional[float]:
+        """Most recent ping round-trip time in seconds, or None before the first pong."""
+        return self.rtt_samples[-1] if self.rtt_samples else None
+    
+    async def _heartbeat(self) -> None:
         """
-        Send session configuration update.
+        Ping the service periodically, recording round-trip times.
         
-        Args:
-            instructions: System instructions for the AI
-            tools: List of function tools available to the AI
-            tool_choice: Tool selection mode ("auto", "none", "required")
-            input_audio_format: Format for input audio
-            output_audio_format: Format for output audio
-            turn_detection_type: VAD type (azure_semantic_vad, azure_semantic_vad_multilingual, server_vad)
-            
-        Returns:
-            True if sent successfully, False otherwise
+        After HEARTBEAT_MAX_MISSES consecutive pings go unanswered the
+        connection is treated as dead and closed, which ends receive_events.
         """
-        if not self.is_connected or not self.websocket:
-            logger.error("Cannot send session update: not connected")
-            return False
+        misses = 0
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+            sent_at = time.monotonic()
+            try:
+                pong_waiter = await self.websocket.ping()
+                await asyncio.wait_for(pong_waiter, HEARTBEAT_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                misses += 1
+                logger.warning("Voice Live ping unanswered (%d/%d)", misses, HEARTBEAT_MAX_MISSES)
+                if misses >= HEARTBEAT_MAX_MISSES:
+                    logger.error("Voice Live connection unresponsive; closing")
+                    self._set_connected(False)
+                    await self._close()
+                    return
+            except websockets.exceptions.ConnectionClosed:
+                return
+            else:
+                misses = 0
+                self.rtt_samples.append(time.monotonic() - sent_at)
+    
+    # Transport hooks; VoiceLiveAiohttpClient overrides these for its connection type
+    
+    # Whether _heartbeat runs for this transport
+    _use_heartbeat = True
+    
+    def _bind_send(self) -> None:
+        """Cache the connection's bound send methods as _send_str/_send_bytes."""
+        self._send_str = self._send_bytes = self.websocket.send
+    
+    async def _send_str(self, data: str) -> None:
+        """Send a text frame."""
+        await self.websocket.send(data)
+    
+    async def _send_bytes(self, data: bytes) -> None:
+        """Send a binary frame."""
+        await self.websocket.send(data)
+    
+    def _frames(self) -> AsyncIterable[Union[str, bytes]]:
+        """Iterate incoming frames as str (text) or bytes (binary)."""
+        return self.websocket
+    
+    async def _close(self) -> None:
+        """Close the underlying connection."""
+        await self.websocket.close()
+    
+    def _session_template(
+        self,
+        input_audio_format: str,
+        output_audio_format: str,
+        turn_detection_type: str,
+    ) -> tuple[str, str]:
+        """
+        Return the serialized session.update split around the instructions value.
         
-        try:
+        Everything except instructions and tools is fixed per format and voice
+        combination, so it is serialized once and reused by send_session_update.
+        """
+        key = (input_audio_format, output_audio_format, turn_detection_type, self.voice, self.temperature, self.rate)
+        template = self._session_templates.get(key)
+        if template is None:
             session_config = {
                 "type": "session.update",
                 "session": {
-                    "instructions": instructions,
+                    "instructions": _INSTRUCTIONS_SENTINEL,
                     "input_audio_format": input_audio_format,
                     "output_audio_format": output_audio_format,
                     "input_audio_transcription": {
@@ -146,20 +447,122 @@ class VoiceLiveWebSocketClient:
                     "modalities": ["text", "audio"],
                 }
             }
+            head, _, tail = json_codec.dumps_str(session_config).partition(
+                json_codec.dumps_str(_INSTRUCTIONS_SENTINEL)
+            )
+            template = self._session_templates[key] = (head, tail)
+        return template
+    
+    def _session_update_frame(
+        self,
+        instructions: str,
+        tools: Optional[list],
+        tool_choice: str,
+        input_audio_format: str,
+        output_audio_format: str,
+        turn_detection_type: str,
+    ) -> str:
+        """Serialize a session.update event from the cached template."""
+        head, tail = self._session_template(input_audio_format, output_audio_format, turn_detection_type)
+        
+        # Add tools if provided; they go last in the session object, before the closing braces
+        if tools:
+            tools_json = json_codec.dumps_str(tools)
+            tail = f'{tail[:-2]},"tools":{tools_json},"tool_choice":{json_codec.dumps_str(tool_choice)}' + "}}"
+        
+        # System prompts are large and rarely change between updates, so reuse the last encoding
+        cached = self._instructions_json
+        if cached is None or (cached[0] is not instructions and cached[0] != instructions):
+            cached = self._instructions_json = (instructions, json_codec.dumps_str(instructions))
+        
+        return head + cached[1] + tail
+    
+    async def send_session_update(
+        self,
+        instructions: str,
+        tools: Optional[list] = None,
+        tool_choice: str = "auto",
+        input_audio_format: str = "pcm16",
+        output_audio_format: str = "pcm16",
+        turn_detection_type: str = "azure_semantic_vad",
+    ) -> bool:
+        """
+        Send session configuration update.
+        
+        Args:
+            instructions: System instructions for the AI
+            tools: List of function tools available to the AI
+            tool_choice: Tool selection mode ("auto", "none", "required")
+            input_audio_format: Format for input audio
+            output_audio_format: Format for output audio
+            turn_detection_type: VAD type (azure_semantic_vad, azure_semantic_vad_multilingual, server_vad)
             
-            # Add tools if provided
-            if tools:
-                session_config["session"]["tools"] = tools
-                session_config["session"]["tool_choice"] = tool_choice
-            
-            await self.websocket.send(json.dumps(session_config))
-            logger.info(f"Sent session.update with voice {self.voice}, turn detection {turn_detection_type}")
+        Returns:
+            True if queued for sending, False otherwise
+        """
+        if not self.is_connected or not self.websocket:
+            logger.error("Cannot send session update: not connected")
+            return False
+        
+        try:
+            frame = self._session_update_frame(
+                instructions, tools, tool_choice, input_audio_format, output_audio_format, turn_detection_type
+            )
+            # Audio buffered before this call goes out ahead of it
+            if not (await self._flush_audio() and await self._enqueue(frame)):
+                logger.error("Cannot send session update: connection lost")
+                return False
+            logger.info("Sent session.update with voice %s, turn detection %s", self.voice, turn_detection_type)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send session update: {e}")
+            logger.error("Failed to send session update: %s", e)
             return False
     
+    async def start(
+        self,
+        instructions: str,
+        tools: Optional[list] = None,
+        tool_choice: str = "auto",
+        input_audio_format: str = "pcm16",
+        output_audio_format: str = "pcm16",
+        turn_detection_type: str = "azure_semantic_vad",
+    ) -> bool:
+        """
+        Connect and configure the session in one step.
+        
+        Takes the same arguments as send_session_update. The session.update
+        frame is encoded while the handshake is in flight and queued as soon as
+        the connection is up. Audio can be sent as soon as this returns; it is
+        queued behind the session.update, with no need to wait for
+        session.updated.
+        
+        Returns:
+            True if connected and the session update was queued, False otherwise
+        """
+        connecting = asyncio.create_task(self.connect())
+        # Let the handshake start before doing the encoding work
+        await asyncio.sleep(0)
+        try:
+            frame = self._session_update_frame(
+                instructions, tools, tool_choice, input_audio_format, output_audio_format, turn_detection_type
+            )
+        except Exception as e:
+            logger.error("Failed to build session update: %s", e)
+            frame = None
+        
+        if not await connecting:
+            return False
+        if frame is None:
+            # Don't leave a live connection behind when reporting failure
+            await self.disconnect()
+            return False
+        if not await self._enqueue(frame):
+            logger.error("Cannot send session update: connection lost")
+            return False
+        logger.info("Sent session.update with voice %s, turn detection %s", self.voice, turn_detection_type)
+        return True
+    
     async def send_audio(self, audio_data: bytes) -> bool:
         """
         Send audio data to the API.
@@ -168,18 +571,76 @@ class VoiceLiveWebSocketClient:
             audio_data: PCM16 audio bytes
             
         Returns:
-            True if sent successfully, False otherwise
+            True if the audio was accepted for sending, False if not connected
+        
+        This class-level implementation is the disconnected state; while connected
+        the instance attribute points at _send_audio_connected instead, so the
+        per-chunk path skips the connection checks.
+        
+        Chunks are buffered and sent together every AUDIO_FLUSH_INTERVAL_SECONDS
+        (or once AUDIO_FLUSH_MAX_BYTES accumulate); call flush_audio() at
+        utterance boundaries to send immediately.
         """
-        if not self.is_connected or not self.websocket:
-            logger.error("Cannot send audio: not connected")
+        logger.error("Cannot send audio: not connected")
+        return False
+    
+    async def send_audio_float32(self, samples: Any, sample_rate: int = pcm.PCM16_SAMPLE_RATE) -> bool:
+        """
+        Convert float32 audio to 24 kHz PCM16 and send it.
+        
+        Args:
+            samples: float32 samples in [-1.0, 1.0] (numpy array, sequence, or raw bytes)
+            sample_rate: Sample rate of samples; other rates are resampled to 24 kHz
+            
+        Returns:
+            Same as send_audio
+        
+        Scaling, clipping and resampling happen in one conversion pass (vectorized
+        when numpy is installed) before the result joins the send buffer.
+        """
+        return await self.send_audio(pcm.float32_to_pcm16(samples, sample_rate))
+    
+    async def _send_audio_connected(self, audio_data: bytes) -> bool:
+        self._audio_buf += audio_data
+        if len(self._audio_buf) >= AUDIO_FLUSH_MAX_BYTES:
+            return await self._flush_audio()
+        elif self._audio_flush_task is None:
+            self._audio_flush_task = asyncio.create_task(self._flush_audio_after(AUDIO_FLUSH_INTERVAL_SECONDS))
+        return True
+    
+    async def _flush_audio_after(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._flush_audio()
+    
+    async def _flush_audio(self) -> bool:
+        """Queue buffered audio as one frame; False if the connection is gone."""
+        task = self._audio_flush_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._audio_flush_task = None
+        
+        if not self._audio_buf:
+            return True
+        if self._send_q is None:
             return False
+        # Hand the filled buffer to the transport as-is and start a new one,
+        # instead of copying it into a bytes object per frame
+        audio_data = self._audio_buf
+        self._audio_buf = bytearray()
+        # Audio is sent as binary WebSocket frames
+        return await self._enqueue(audio_data)
+    
+    async def flush_audio(self) -> bool:
+        """
+        Queue any buffered audio for sending immediately.
         
+        Returns:
+            True if queued (or nothing was buffered), False otherwise
+        """
         try:
-            # Audio is sent as binary WebSocket frames
-            await self.websocket.send(audio_data)
-            return True
+            return await self._flush_audio()
         except Exception as e:
-            logger.error(f"Failed to send audio: {e}")
+            logger.error("Failed to send audio: %s", e)
             return False
     
     async def send_text(self, text: str) -> bool:
@@ -190,7 +651,7 @@ class VoiceLiveWebSocketClient:
             text: Text content to send
             
         Returns:
-            True if sent successfully, False otherwise
+            True if queued for sending, False otherwise
         """
         if not self.is_connected or not self.websocket:
             logger.error("Cannot send text: not connected")
@@ -210,52 +671,87 @@ class VoiceLiveWebSocketClient:
                     ]
                 }
             }
-            await self.websocket.send(json.dumps(message))
-            
-            # Trigger response generation
-            await self.websocket.send(json.dumps({"type": "response.create"}))
+            # Add the message and trigger response generation
+            if not await self._send_item_and_respond(json_codec.dumps_str(message)):
+                logger.error("Cannot send text: connection lost")
+                return False
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send text: {e}")
+            logger.error("Failed to send text: %s", e)
             return False
     
+    async def _send_item_and_respond(self, item_frame: str) -> bool:
+        """
+        Send a conversation item followed by response.create.
+        
+        The Realtime protocol accepts exactly one event per frame, so the two
+        events cannot share a frame; both are queued back to back so the
+        writer sends them consecutively. Audio still in the coalescing buffer
+        was spoken before this item, so it is queued first.
+        
+        Returns False if the connection is gone.
+        """
+        return (
+            await self._flush_audio()
+            and await self._enqueue(item_frame)
+            and await self._enqueue(_RESPONSE_CREATE)
+        )
+    
     async def receive_events(
         self,
-        callback: Callable[[Dict[str, Any]], Awaitable[None]]
+        callback: Callable[[Union[ServerEvent, AudioDataEvent]], Awaitable[None]],
+        on_audio: Optional[Callable[[bytes], Awaitable[None]]] = None,
+        handlers: Optional[Dict[str, EventHandler]] = None,
     ) -> None:
         """
         Receive and process events from the API.
         
         Args:
-            callback: Async function to handle received events
+            callback: Async function to handle received events without a dedicated handler
+            on_audio: Async function receiving binary audio frames as raw bytes; when omitted
+                they are passed to callback wrapped as {"type": "audio.data", "audio": ...}.
+                Each frame is the transport's own bytes object, handed over without a copy
+                and not retained by the client, so consumers can take memoryview(frame)
+                slices or keep the frame as-is.
+            handlers: Optional map of event type to async handler, checked before callback
         """
         if not self.is_connected or not self.websocket:
             logger.error("Cannot receive events: not connected")
             return
         
+        get_handler = (handlers or {}).get
+        
         try:
-            async for message in self.websocket:
+            async for message in self._frames():
                 if isinstance(message, bytes):
                     # Binary audio data
-                    await callback({
-                        "type": "audio.data",
-                        "audio": message
-                    })
-                else:
-                    # JSON event
-                    try:
-                        event = json.loads(message)
-                        await callback(event)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse JSON event: {e}")
+                    if on_audio is not None:
+                        await on_audio(message)
+                    else:
+                        await callback({
+                            "type": "audio.data",
+                            "audio": message
+                        })
+                    continue
+                
+                # JSON event
+                try:
+                    event = json_codec.loads(message)
+                except json_codec.JSONDecodeError as e:
+                    logger.error("Failed to parse JSON event: %s", e)
+                    continue
+                await get_handler(event.get("type"), callback)(event)
+            
+            logger.info("Voice Live WebSocket connection closed")
+            self._set_connected(False)
                         
         except websockets.exceptions.ConnectionClosed:
             logger.info("Voice Live WebSocket connection closed")
-            self.is_connected = False
+            self._set_connected(False)
         except Exception as e:
-            logger.error(f"Error receiving events: {e}")
-            self.is_connected = False
+            logger.error("Error receiving events: %s", e)
+            self._set_connected(False)
     
     async def send_function_call_output(
         self,
@@ -270,37 +766,48 @@ class VoiceLiveWebSocketClient:
             output: Function execution result
             
         Returns:
-            True if sent successfully, False otherwise
+            True if queued for sending, False otherwise
         """
         if not self.is_connected or not self.websocket:
             logger.error("Cannot send function output: not connected")
             return False
         
         try:
-            message = {
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "function_call_output",
-                    "call_id": call_id,
-                    "output": json.dumps(output)
-                }
-            }
-            await self.websocket.send(json.dumps(message))
-            
-            # Trigger response generation
-            await self.websocket.send(json.dumps({"type": "response.create"}))
-            logger.info(f"Sent function call output for {call_id}")
+            if _json_size_exceeds(output, LARGE_TOOL_OUTPUT_BYTES):
+                # Encoding (and then escaping) a large result takes milliseconds; keep it off the event loop
+                item_frame = await asyncio.get_running_loop().run_in_executor(
+                    None, _encode_function_call_output, call_id, output
+                )
+            else:
+                item_frame = _encode_function_call_output(call_id, output)
+            # Add the output and trigger response generation
+            if not await self._send_item_and_respond(item_frame):
+                logger.error("Cannot send function output: connection lost")
+                return False
+            logger.info("Sent function call output for %s", call_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send function output: {e}")
+            logger.error("Failed to send function output: %s", e)
             return False
     
-    async def disconnect(self) -> None:
-        """Close the WebSocket connection."""
+    async def disconnect(self, flush: bool = True) -> None:
+        """
+        Close the WebSocket connection.
+        
+        Args:
+            flush: Wait (up to CLOSE_TIMEOUT_SECONDS) for queued frames to be
+                written first; anything still unsent after that is dropped
+        """
         if self.websocket:
-            await self.websocket.close()
-            self.is_connected = False
+            if flush and self.is_connected:
+                try:
+                    await asyncio.wait_for(self.flush(), CLOSE_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    logger.warning("Timed out flushing Voice Live sends; closing anyway")
+            # Stop the writer (which may be stuck in a send on a stalled link) before closing
+            self._set_connected(False)
+            await self._close()
             logger.info("Voice Live WebSocket disconnected")
     
     @classmethod
@@ -315,7 +822,11 @@ class VoiceLiveWebSocketClient:
             - VOICE_LIVE_VOICE (optional)
             - VOICE_LIVE_TEMPERATURE (optional)
             - VOICE_LIVE_RATE (optional)
+            - VOICE_LIVE_TRANSPORT (optional): "aiohttp" selects VoiceLiveAiohttpClient
         """
+        if cls is VoiceLiveWebSocketClient and os.getenv("VOICE_LIVE_TRANSPORT", "").lower() == "aiohttp":
+            cls = VoiceLiveAiohttpClient
+        
         endpoint = os.getenv("VOICE_LIVE_WEBSOCKET_ENDPOINT")
         api_key = os.getenv("VOICE_LIVE_API_KEY")
         
@@ -330,3 +841,77 @@ class VoiceLiveWebSocketClient:
             temperature=float(os.getenv("VOICE_LIVE_TEMPERATURE", "0.8")),
             rate=os.getenv("VOICE_LIVE_RATE", "1.0"),
         )
+
+
+class VoiceLiveAiohttpClient(VoiceLiveWebSocketClient):
+    """
+    VoiceLiveWebSocketClient running over aiohttp's WebSocket client.
+    
+    Same API as the websockets-based client; aiohttp's reader has a cheaper
+    per-frame path, which matters for a steady stream of small audio frames.
+    Selected by from_env when VOICE_LIVE_TRANSPORT=aiohttp.
+    
+    Connections are opened on the process-wide shared session; disconnect()
+    closes only the WebSocket, and close_shared_session() releases the session.
+    
+    Keepalive uses aiohttp's own heartbeat, which doesn't expose round-trip
+    times, so rtt_samples stays empty for this transport.
+    """
+    
+    _use_heartbeat = False
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
+    
+    async def connect(self) -> bool:
+        """
+        Establish WebSocket connection to Voice Live API.
+        
+        Returns:
+            True if connection successful, False otherwise
+        """
+        if self.is_connected:
+            # Reconnecting: close the old socket and stop its writer and heartbeat first.
+            # The old link is usually the reason for reconnecting, so don't wait on its queue.
+            await self.disconnect(flush=False)
+        try:
+            logger.info("Connecting to Voice Live API (aiohttp): %s", self._connection_url)
+            self.websocket = await _get_shared_session().ws_connect(
+                self._connection_url,
+                headers=self._headers,
+                compress=0,  # PCM16 audio doesn't compress; skip the per-frame zlib pass
+                max_msg_size=MAX_MESSAGE_BYTES,
+                heartbeat=HEARTBEAT_INTERVAL_SECONDS,
+                autoping=True,
+            )
+            
+            self._set_connected(True)
+            logger.info("Voice Live WebSocket connection established")
+            return True
+            
+        except Exception as e:
+            logger.error("Failed to connect to Voice Live API: %s", e)
+            self._set_connected(False)
+            return False
+    
+    def _bind_send(self) -> None:
+        self._send_str = self.websocket.send_str
+        self._send_bytes = self.websocket.send_bytes
+    
+    async def _send_str(self, data: str) -> None:
+        await self.websocket.send_str(data)
+    
+    async def _send_bytes(self, data: bytes) -> None:
+        await self.websocket.send_bytes(data)
+    
+    async def _frames(self) -> AsyncIterable[Union[str, bytes]]:
+        # aiohttp's iterator already stops on CLOSE/CLOSING/CLOSED
+        async for msg in self.websocket:
+            if msg.type == aiohttp.WSMsgType.BINARY or msg.type == aiohttp.WSMsgType.TEXT:
+                yield msg.data
+            elif msg.type == aiohttp.WSMsgType.ERROR:
+                raise self.websocket.exception() or ConnectionError("Voice Live WebSocket error")
+    
+    async def _close(self) -> None:
+        await self.websocket.close()